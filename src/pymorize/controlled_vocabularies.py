@@ -2,7 +2,6 @@
 Controlled vocabularies for CMIP6
 """
 
-import glob
 import json
 import os
 
@@ -37,7 +36,12 @@ class ControlledVocabularies(dict):
         cmip6_cvs_dir : str
             Path to the directory containing the json files
         """
-        json_files = glob.glob(os.path.join(cmip6_cvs_dir, "*.json"))
+        with os.scandir(cmip6_cvs_dir) as entries:
+            json_files = sorted(
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
         return cls(json_files)
 
     def print_experiment_ids(self):
@@ -1,3 +1,4 @@
+import os
 import pathlib
 from abc import abstractmethod
 from enum import Enum
@@ -90,12 +91,20 @@ class CMIP6DataRequest(DataRequest):
     def from_directory(cls, directory: str) -> "CMIP6DataRequest":
         tables = {}
         directory = pathlib.Path(directory)
-        for file in directory.iterdir():
-            if file.is_file() and file.suffix == ".json":
-                if file.name in cls._IGNORE_TABLE_FILES:
-                    continue
-                table = CMIP6DataRequestTable.from_json_file(file)
-                tables[table.table_id] = table
+        # os.scandir reuses the file type from the directory listing, so no
+        # extra stat call is needed per entry. Sorting keeps the table order
+        # independent of the filesystem.
+        with os.scandir(directory) as entries:
+            table_files = sorted(
+                entry.path
+                for entry in entries
+                if entry.is_file()
+                and entry.name.endswith(".json")
+                and entry.name not in cls._IGNORE_TABLE_FILES
+            )
+        for file in table_files:
+            table = CMIP6DataRequestTable.from_json_file(file)
+            tables[table.table_id] = table
 
         for table in tables.values():
             if table in CMIP6IgnoreTableFiles.values():
@@ -1,3 +1,4 @@
+import functools
 import json
 from abc import abstractmethod
 from dataclasses import dataclass
@@ -9,6 +10,17 @@ from semver.version import Version
 from .factory import MetaFactory
 from .variable import CMIP6DataRequestVariable, DataRequestVariable
 
+
+@functools.lru_cache(maxsize=128)
+def _load_json(jfile: str) -> dict:
+    """Read and parse a JSON table file, caching the result by path.
+
+    The returned dictionary is shared between callers and must not be modified.
+    """
+    with open(jfile, "r") as f:
+        return json.load(f)
+
+
 ################################################################################
 # BLUEPRINTS: Abstract classes for the data request tables
 ################################################################################
@@ -281,10 +293,9 @@ class CMIP6DataRequestTableHeader(DataRequestTableHeader):
 class CMIP6JSONDataRequestTableHeader(CMIP6DataRequestTableHeader):
     @classmethod
     def from_json_file(cls, jfile) -> "CMIP6JSONDataRequestTableHeader":
-        with open(jfile, "r") as f:
-            data = json.load(f)
-            header = data["Header"]
-            return cls.from_dict(header)
+        data = _load_json(str(jfile))
+        header = data["Header"]
+        return cls.from_dict(header)
 
 
 ################################################################################
@@ -301,6 +312,9 @@ class CMIP6DataRequestTable(DataRequestTable):
     ):
         self._header = header
         self._variables = variables
+        self._variables_by_name = {}
+        for v in variables:
+            self._variables_by_name.setdefault(v.name, v)
 
     @property
     def variables(self) -> List[str]:
@@ -325,6 +339,8 @@ class CMIP6DataRequestTable(DataRequestTable):
         -------
         DataRequestVariable
         """
+        if find_by == "name" and name in self._variables_by_name:
+            return self._variables_by_name[name]
         for v in self._variables:
             if getattr(v, find_by) == name:
                 return v
@@ -343,8 +359,7 @@ class CMIP6DataRequestTable(DataRequestTable):
 
     @classmethod
     def from_json_file(cls, jfile) -> "CMIP6DataRequestTable":
-        with open(jfile, "r") as f:
-            data = json.load(f)
+        data = _load_json(str(jfile))
         return cls.from_dict(data)
 
 
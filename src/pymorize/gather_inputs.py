@@ -5,7 +5,8 @@ Functionality for gathering possible inputs from a user directory
 import os
 import pathlib
 import re
-from typing import List
+import weakref
+from typing import List, Union
 
 import deprecation
 import dpath
@@ -22,12 +23,49 @@ _PATTERN_ENV_VAR_VALUE_ADDR = "/pymorize/pattern_env_var_value"
 """str: The address in the YAML file which stores the environment variable's value"""
 _PATTERN_ENV_VAR_VALUE_DEFAULT = ".*"  # Default: match anything
 """str: The default value for the environment variable's value to be used if the variable is not set"""
+_PATTERN_CACHE = weakref.WeakValueDictionary()
+"""WeakValueDictionary: Compiled patterns, keyed by the ``(pattern, flags)`` they were compiled from"""
+
+
+def _compile_pattern(pattern: Union[str, re.Pattern], flags: int = 0) -> re.Pattern:
+    """
+    Compile a regular expression, reusing the compiled object for repeated patterns.
+
+    Parameters
+    ----------
+    pattern : str or re.Pattern
+        The regular expression to compile. Already compiled patterns are returned as is.
+    flags : int, optional
+        Flags to compile a string ``pattern`` with, e.g. ``re.IGNORECASE``.
+
+    Returns
+    -------
+    re.Pattern
+        The compiled regular expression.
+
+    Examples
+    --------
+    >>> _compile_pattern("var1.*.nc") is _compile_pattern("var1.*.nc")
+    True
+    >>> compiled = re.compile("var2.*.nc")
+    >>> _compile_pattern(compiled) is compiled
+    True
+    >>> _compile_pattern("var1.*.nc", re.IGNORECASE) is _compile_pattern("var1.*.nc")
+    False
+    """
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    key = (pattern, flags)
+    compiled = _PATTERN_CACHE.get(key)
+    if compiled is None:
+        compiled = _PATTERN_CACHE[key] = re.compile(pattern, flags)
+    return compiled
 
 
 class InputFileCollection:
     def __init__(self, path, pattern, frequency=None, time_dim_name=None):
         self.path = pathlib.Path(path)
-        self.pattern = re.compile(pattern)  # Compile the regex pattern
+        self.pattern = _compile_pattern(pattern)  # Compile the regex pattern
         self.frequency = frequency
         self.time_dim_name = time_dim_name
 
@@ -97,6 +135,8 @@ def _input_pattern_from_env(config: dict) -> re.Pattern:
     re.compile('.*')
     >>> bool(pattern.match('test'))
     True
+    >>> _input_pattern_from_env(config_bare) is _input_pattern_from_env(config_bare)
+    True
     """
     env_var_name = dpath.get(
         config, _PATTERN_ENV_VAR_NAME_ADDR, default=_PATTERN_ENV_VAR_NAME_DEFAULT
@@ -107,7 +147,7 @@ def _input_pattern_from_env(config: dict) -> re.Pattern:
             config, _PATTERN_ENV_VAR_VALUE_ADDR, default=_PATTERN_ENV_VAR_VALUE_DEFAULT
         ),
     )
-    return re.compile(env_var_value)
+    return _compile_pattern(env_var_value)
 
 
 def _input_files_in_path(path: pathlib.Path or str, pattern: re.Pattern) -> list:
@@ -276,6 +316,10 @@ def load_mfdataset(data, rule_spec):
     logger.info(f"Loading {len(all_files)} files using {engine} backend on xarray...")
     for f in all_files:
         logger.info(f"  * {f}")
+    if len(all_files) == 1:
+        # Skip the combine machinery of open_mfdataset, chunks={} keeps the result
+        # lazy and chunked just like the multi-file case:
+        return xr.open_dataset(all_files[0], chunks={}, use_cftime=True, engine=engine)
     mf_ds = xr.open_mfdataset(all_files, parallel=True, use_cftime=True, engine=engine)
     return mf_ds
 
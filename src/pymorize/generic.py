@@ -29,7 +29,7 @@ def load_data(data, rule_spec, *args, **kwargs):
     """Loads data described by the rule_spec."""
     ds_list = []
     for pattern in rule_spec["input_patterns"]:
-        ds = xr.open_mfdataset(pattern, combine="by_coords")
+        ds = xr.open_mfdataset(pattern, combine="by_coords", parallel=True)
         ds_list.append(ds)
     data = xr.concat(ds_list, dim="time")
     return data
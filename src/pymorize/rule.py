@@ -1,5 +1,4 @@
 import copy
-import re
 import typing
 import warnings
 
@@ -9,7 +8,7 @@ import yaml
 from . import pipeline
 from .data_request.table import DataRequestTable
 from .data_request.variable import DataRequestVariable
-from .gather_inputs import InputFileCollection
+from .gather_inputs import InputFileCollection, _compile_pattern
 from .logging import logger
 
 # import deprecation
@@ -35,7 +34,8 @@ class Rule:
         Parameters
         ----------
         inputs : list of dicts for InputFileCollection
-            Dictionaries should contain the keys "path" and "pattern".
+            Dictionaries should contain the keys "path" and "pattern". The pattern
+            may be given as a string or as an already compiled ``re.Pattern``.
         cmor_variable : str
             The CMOR variable name. This is the name of the variable as it should appear in the CMIP archive.
         pipelines : list of Pipeline objects
@@ -251,7 +251,10 @@ class Rule:
     @property
     def input_patterns(self):
         """Return a list of compiled regex patterns for the input files."""
-        return [re.compile(f"{inp.path}/{inp.pattern}") for inp in self.inputs]
+        return [
+            _compile_pattern(f"{inp.path}/{inp.pattern.pattern}", inp.pattern.flags)
+            for inp in self.inputs
+        ]
 
     def clone(self):
         """Creates a copy of this rule object as it is currently configured."""
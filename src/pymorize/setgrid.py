@@ -39,17 +39,20 @@ def setgrid(
     ----------
     da : xr.Dataset or xr.DataArray
         The input dataarray or dataset.
-    rule: Rule object containing gridfile attribute
+    rule: Rule object containing gridfile attribute. An already opened grid can be
+        passed as ``grid`` instead, which skips reading ``grid_file`` from disk.
 
     Returns
     -------
     xr.Dataset
         The output dataarray or dataset with the grid information.
     """
-    gridfile = rule.get("grid_file")
-    if gridfile is None:
-        raise ValueError("Missing grid file. Please set 'grid_file' in the rule.")
-    grid = xr.open_dataset(gridfile)
+    grid = rule.get("grid")
+    if not isinstance(grid, xr.Dataset):
+        gridfile = rule.get("grid_file")
+        if gridfile is None:
+            raise ValueError("Missing grid file. Please set 'grid_file' in the rule.")
+        grid = xr.open_dataset(gridfile)
     required_dims = set(sum([gc.dims for _, gc in grid.coords.items()], ()))
     to_rename = {}
     can_merge = False
@@ -20,6 +20,9 @@ _get_time_method(frequency: str) -> str:
 _frequency_from_approx_interval(interval: str) -> str:
     Convert an interval expressed in days to a frequency string.
 
+_get_offset(approx_interval: str) -> pd.Timedelta:
+    Compute the offset to the middle of an averaging interval.
+
 _compute_file_timespan(da: xr.DataArray) -> int:
     Compute the timespan of a given data array.
 
@@ -28,15 +31,19 @@ timeavg(da: xr.DataArray, rule: Dict) -> xr.DataArray:
 
 Module Variables
 ----------------
+_APPROX_INTERVAL_NOTATION : tuple
+    Time units used to express approximate intervals as frequency strings.
+
 _IGNORED_CELL_METHODS : list
     List of cell_methods to ignore when calculating time averages.
 
 """
 
+import bisect
 import functools
 import itertools
+import math
 
-import numpy as np
 import pandas as pd
 import xarray as xr
 
@@ -60,31 +67,46 @@ def _split_by_chunks(dataset: xr.DataArray):
     tuple
         A tuple containing the selection dictionary and the corresponding sub-dataset.
 
+    Raises
+    ------
+    TypeError
+        If the input is not an xarray object.
+    ValueError
+        If the input is not chunked.
+
     References
     ----------
     .. [1] https://github.com/pydata/xarray/issues/1093#issuecomment-259213382
     """
-    chunk_slices = {}
-    logger.info(f"{dataset.chunks=}")
+    if not isinstance(dataset, (xr.Dataset, xr.DataArray)):
+        raise TypeError(f"Expected xr.Dataset or xr.DataArray, got {type(dataset)}")
+    # Unchunked (numpy-backed) data has nothing to split
     if not dataset.chunks:
         raise ValueError("Dataset has no chunks")
+    logger.info(f"{dataset.chunks=}")
     if isinstance(dataset, xr.Dataset):
         chunker = dataset.chunks
-    elif isinstance(dataset, xr.DataArray):
+    else:
         chunker = {dim: chunk for dim, chunk in zip(dataset.dims, dataset.chunks)}
-    for dim, chunks in chunker.items():
-        slices = []
-        start = 0
-        for chunk in chunks:
-            stop = start + chunk
-            slices.append(slice(start, stop))
-            start = stop
-        chunk_slices[dim] = slices
-    for slices in itertools.product(*chunk_slices.values()):
-        selection = dict(zip(chunk_slices.keys(), slices))
+    # A single chunk covers the whole dataset, no need to index into it:
+    if all(len(chunks) == 1 for chunks in chunker.values()):
+        yield ({dim: slice(0, chunks[0]) for dim, chunks in chunker.items()}, dataset)
+        return
+    # The chunk boundaries of each dimension are the running sums of its chunk sizes
+    dims = list(chunker)
+    chunk_slices = [
+        [
+            slice(stop - size, stop)
+            for size, stop in zip(chunks, itertools.accumulate(chunks))
+        ]
+        for chunks in chunker.values()
+    ]
+    for slices in itertools.product(*chunk_slices):
+        selection = dict(zip(dims, slices))
         yield (selection, dataset[selection])
 
 
+@functools.lru_cache(maxsize=None)
 def _get_time_method(frequency: str) -> str:
     """
     Determine the time method based on the frequency string from CMIP6 table for
@@ -109,6 +131,28 @@ def _get_time_method(frequency: str) -> str:
     return "MEAN"
 
 
+_APPROX_INTERVAL_NOTATION = (
+    ("millisecond", lambda x: f"{x}ms", 1.0 / (24 * 60 * 60 * 1000)),
+    ("second", lambda x: f"{x}s", 1.0 / (24 * 60 * 60)),
+    ("minute", lambda x: f"{x}min", 1.0 / (24 * 60)),
+    ("hour", lambda x: f"{x}H", 1 / 24),
+    ("day", lambda x: f"{x}D", 1),
+    ("month", lambda x: f"{x}ME", 30),
+    ("year", lambda x: f"{x}YE", 365),
+    ("year", lambda x: f"{x}YE", 366),
+    ("decade", lambda x: f"{x*10}YE" if x else "10YE", 3650),
+)
+"""tuple: ``(name, formatter, length in days)`` of each time unit, shortest first"""
+
+_APPROX_INTERVAL_LOWER_BOUNDS = [
+    # An interval selects a unit if it is at least as long, or close to it in the
+    # sense of ``np.isclose(interval, length, rtol=1e-3)`` (with its default atol)
+    length - (1e-8 + 1e-3 * length)
+    for _, _, length in _APPROX_INTERVAL_NOTATION
+]
+"""list: Smallest interval (in days) which still selects the matching unit"""
+
+
 def _frequency_from_approx_interval(interval: str):
     """
     Convert an interval expressed in days to a frequency string.
@@ -132,36 +176,59 @@ def _frequency_from_approx_interval(interval: str):
     ValueError
         If the interval cannot be converted to a float.
     """
-    notation = [
-        ("decade", lambda x: f"{x*10}YE" if x else "10YE", 3650),
-        ("year", lambda x: f"{x}YE", 366),
-        ("year", lambda x: f"{x}YE", 365),
-        ("month", lambda x: f"{x}ME", 30),
-        ("day", lambda x: f"{x}D", 1),
-        ("hour", lambda x: f"{x}H", 1 / 24),
-        ("minute", lambda x: f"{x}min", 1.0 / (24 * 60)),
-        ("second", lambda x: f"{x}s", 1.0 / (24 * 60 * 60)),
-        ("millisecond", lambda x: f"{x}ms", 1.0 / (24 * 60 * 60 * 1000)),
-    ]
     try:
         interval = float(interval)
     except ValueError:
         raise ValueError(f"Invalid interval: {interval}")
-    isclose = functools.partial(np.isclose, rtol=1e-3)
-    for name, func, val in notation:
-        if (interval >= val) or isclose(interval, val):
-            value = round(interval / val)
-            value = "" if value == 1 else value
-            return func(value)
+    # NaN compares false against every bound, which bisect would treat as larger:
+    if math.isnan(interval):
+        return None
+    index = bisect.bisect_right(_APPROX_INTERVAL_LOWER_BOUNDS, interval) - 1
+    if index < 0:
+        return None
+    name, func, val = _APPROX_INTERVAL_NOTATION[index]
+    value = round(interval / val)
+    value = "" if value == 1 else value
+    return func(value)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_offset(approx_interval: str) -> pd.Timedelta:
+    """
+    Compute the offset which moves a time stamp to the middle of its averaging interval.
+
+    Only a handful of distinct intervals appear in the CMIP tables, so the result is
+    cached per interval.
+
+    Parameters
+    ----------
+    approx_interval : str
+        The approximate interval expressed in days, as given in the table header.
+
+    Returns
+    -------
+    pd.Timedelta
+        Half of the interval.
+
+    Examples
+    --------
+    >>> _get_offset("30.00000")
+    Timedelta('15 days 00:00:00')
+    >>> _get_offset("0.125000")
+    Timedelta('0 days 01:30:00')
+    """
+    return pd.Timedelta(float(approx_interval), unit="D") / 2
 
 
 def _compute_file_timespan(da: xr.DataArray):
     """
     Compute the timespan of a given data array.
 
-    This function splits the data array into chunks and computes the timespan of each chunk.
-    The timespan of a chunk is defined as the difference between the last and the first time point in the chunk.
-    The function returns the maximum timespan among all chunks.
+    This function looks at the chunks of the data array along ``time`` and computes the
+    timespan of each of the first (up to) three chunks. The timespan of a chunk is defined
+    as the difference between the last and the first time point in the chunk. Only the
+    time coordinate is read, the chunked data itself is never computed.
+    The function returns the maximum timespan among these chunks.
 
     Parameters
     ----------
@@ -179,22 +246,23 @@ def _compute_file_timespan(da: xr.DataArray):
     # Check if "time" dimension is empty
     if da.time.size == 0:
         raise ValueError("no time values in this chunk")
-    chunks = _split_by_chunks(da)
-    tmp_file_timespan = []
-    for i in range(3):
-        try:
-            subset_name, subset = next(chunks)
-        except StopIteration:
-            break
-        else:
-            logger.info(f"{subset_name=}")
-            logger.info(f"{subset.time.data[-1]=}")
-            logger.info(f"{subset.time.data[0]=}")
-            tmp_file_timespan.append(
-                pd.Timedelta(subset.time.data[-1] - subset.time.data[0]).days
-            )
-    if not tmp_file_timespan:
+    # Only the chunk boundaries along time are needed, which can be read off the
+    # chunk sizes and the (in-memory) time coordinate without touching the data:
+    time_chunks = da.chunksizes.get("time")
+    if not time_chunks:
+        raise ValueError("Dataset has no chunks")
+    logger.info(f"{time_chunks=}")
+    stops = list(itertools.accumulate(time_chunks[:3]))
+    if not stops:
         raise ValueError("No chunks found")
+    # Pull just the first and last time point of each chunk from the coordinate:
+    starts = [stop - size for size, stop in zip(time_chunks, stops)]
+    bounds = da["time"].isel(time=starts + [stop - 1 for stop in stops]).values
+    n = len(stops)
+    first, last = bounds[:n], bounds[n:]
+    tmp_file_timespan = [
+        pd.Timedelta(end - begin).days for begin, end in zip(first, last)
+    ]
     file_timespan = max(tmp_file_timespan)
     return file_timespan
 
@@ -225,7 +293,6 @@ def compute_average(da: xr.DataArray, rule):
     )
     drv = rule.data_request_variable
     approx_interval = drv.table_header.approx_interval
-    approx_interval_in_hours = pd.offsets.Hour(float(approx_interval) * 24)
     frequency_str = _frequency_from_approx_interval(approx_interval)
     logger.debug(f"{approx_interval=} {frequency_str=}")
     # attach the frequency_str to rule, it is referenced when creating file name
@@ -238,7 +305,7 @@ def compute_average(da: xr.DataArray, rule):
         ds = da.resample(time=frequency_str).mean()
         adjust_timestamp = rule.get("adjust_timestamp", True)
         if adjust_timestamp:
-            offset = pd.Timedelta(approx_interval_in_hours / 2)
+            offset = _get_offset(approx_interval)
             logger.info(f"{offset=}")
             ds["time"] = ds.time.to_pandas() + offset
     elif time_method == "CLIMATOLOGY":
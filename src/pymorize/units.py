@@ -11,13 +11,13 @@ is used for the conversion. `data/dimensionless_mappings.yaml` contains some
 examples on how the mapping is written.
 """
 
+import functools
 import re
 from typing import Pattern, Union
 
 import cf_xarray.units  # noqa: F401 # pylint: disable=unused-import
 import pint_xarray
 import xarray as xr
-from chemicals import periodic_table
 
 from .logging import logger
 from .rule import Rule
@@ -25,19 +25,54 @@ from .rule import Rule
 ureg = pint_xarray.unit_registry
 
 
-def handle_chemicals(
-    s: Union[str, None] = None, pattern: Pattern = re.compile(r"mol(?P<symbol>\w+)")
-):
+@functools.lru_cache(maxsize=None)
+def _element_molecular_weights() -> dict:
+    """Molecular weight in ``g/mol`` of every chemical element, keyed by its symbol.
+
+    ``chemicals`` is slow to import, so the periodic table is only loaded on first use.
+
+    Returns
+    -------
+    dict
+    """
+    from chemicals import periodic_table
+
+    return {element.symbol: element.MW for element in periodic_table}
+
+
+@functools.lru_cache(maxsize=None)
+def _chemical_element_pattern() -> Pattern:
+    """``mol`` followed by a chemical element symbol, longest symbols first.
+
+    Trying the longer symbols first ensures that e.g. ``mmolFe`` is matched as iron
+    rather than stopping early at a shorter symbol.
+
+    Returns
+    -------
+    re.Pattern
+    """
+    symbols = sorted(
+        map(re.escape, _element_molecular_weights()), key=len, reverse=True
+    )
+    return re.compile(r"mol(?P<symbol>" + "|".join(symbols) + r")(?![a-z])")
+
+
+_CHEMICALS_HANDLED = set()
+"""set: ``(units, pattern)`` pairs already processed by :func:`handle_chemicals`"""
+
+
+def handle_chemicals(s: Union[str, None] = None, pattern: Union[Pattern, None] = None):
     """Registers known chemical elements definitions to global ``ureg`` (unit registry)
 
     Parameters
     ----------
     s: str or None
         string to search for chemical elements based upon the symbol, e.g. ``C`` for carbon.
-    pattern: re.Pattern
+    pattern: re.Pattern or None
         compiled regex pattern to search for chemical elements. This should contain a
         `named group <https://docs.python.org/3/howto/regex.html#non-capturing-and-named-groups>`_ ``symbol``
         to extract the symbol of the chemical element from a potentially larger string.
+        By default, ``mol`` followed by any symbol from the periodic table is matched.
 
     Raises
     ------
@@ -51,24 +86,89 @@ def handle_chemicals(
     """
     if s is None:
         return
+    if pattern is None:
+        # Units without any amount of substance cannot name an element, which
+        # spares loading the periodic table for most units:
+        if "mol" not in s:
+            return
+        pattern = _chemical_element_pattern()
+    # Any definition needed for ``s`` is registered on the first call, so repeated
+    # calls can skip parsing the units and searching the periodic table again.
+    key = (s, pattern.pattern)
+    if key in _CHEMICALS_HANDLED:
+        return
     match = pattern.search(s)
     if match:
-        d = match.groupdict()
+        symbol = match.group("symbol")
         try:
-            element = getattr(periodic_table, d["symbol"])
-        except AttributeError:
-            raise ValueError(
-                f"Unknown chemical element {d.groupdict()['symbol']} in {d.group()}"
-            )
+            molecular_weight = _element_molecular_weights()[symbol]
+        except KeyError:
+            raise ValueError(f"Unknown chemical element {symbol} in {match.group()}")
         else:
             try:
                 ureg(s)
             except pint_xarray.pint.errors.UndefinedUnitError:
-                logger.debug(f"Chemical element {element.name} detected in units {s}.")
+                logger.debug(f"Chemical element {symbol} detected in units {s}.")
                 logger.debug(
-                    f"Registering definition: {match.group()} = {element.MW} * g"
+                    f"Registering definition: {match.group()} = {molecular_weight} * g"
                 )
-                ureg.define(f"{match.group()} = {element.MW} * g")
+                ureg.define(f"{match.group()} = {molecular_weight} * g")
+    _CHEMICALS_HANDLED.add(key)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_unit(unit: str) -> pint_xarray.pint.Unit:
+    """Parse a units string into a unit of the global ``ureg``, caching the result.
+
+    Parameters
+    ----------
+    unit: str
+        units string to parse
+
+    Returns
+    -------
+    ~pint.Unit
+    """
+    return ureg.Unit(unit)
+
+
+@functools.lru_cache(maxsize=1024)
+def _conversion_factor(from_unit: str, to_unit: str) -> Union[float, None]:
+    """Scalar multiplier which converts values given in ``from_unit`` to ``to_unit``.
+
+    The result is memoized per unit pair, so pint only parses the unit strings and
+    performs the dimensional analysis once for every pair seen during a run.
+
+    Parameters
+    ----------
+    from_unit: str
+        unit the data is given in
+    to_unit: str
+        unit to convert the data to
+
+    Returns
+    -------
+    float or None
+        The multiplier, or ``None`` if the conversion has an offset (e.g. ``degC`` to
+        ``K``) and can therefore not be expressed as a single factor.
+
+    Raises
+    ------
+    ValueError
+        If one of the units cannot be parsed, or if the units are incompatible.
+    """
+    try:
+        zero = ureg.Quantity(0.0, from_unit).to(to_unit)
+        one = ureg.Quantity(1.0, from_unit).to(to_unit)
+    except pint_xarray.pint.errors.UndefinedUnitError as e:
+        raise ValueError(f"Cannot parse units: {e}")
+    except pint_xarray.pint.errors.DimensionalityError as e:
+        raise ValueError(f"Incompatible units: {e}")
+    except pint_xarray.pint.errors.PintError as e:
+        raise ValueError(f"Cannot convert units: {e}")
+    if zero.magnitude != 0:
+        return None
+    return float(one.magnitude)
 
 
 def handle_unit_conversion(da: xr.DataArray, rule: Rule) -> xr.DataArray:
@@ -158,8 +258,13 @@ def handle_unit_conversion(da: xr.DataArray, rule: Rule) -> xr.DataArray:
     # Unit conversion
     # ---------------
     try:
-        new_da = da.pint.quantify(from_unit)
-        new_da = new_da.pint.to(_to_unit).pint.dequantify()
+        factor = _conversion_factor(from_unit, _to_unit)
+        if factor is None:
+            new_da = da.pint.quantify(_parse_unit(from_unit))
+            new_da = new_da.pint.to(_parse_unit(_to_unit)).pint.dequantify()
+        else:
+            new_da = da.copy(data=da.data * factor)
+            new_da.attrs["units"] = to_unit
     except ValueError as e:
         logger.error(
             f"Unit conversion of '{cmor_variable_id}' from {from_unit} to {to_unit} "
@@ -3,7 +3,7 @@ import pytest
 from tests.utils.constants import TEST_ROOT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def CMIP_Tables_Dir():
     return TEST_ROOT / "data" / "cmip6-cmor-tables" / "Tables"
 
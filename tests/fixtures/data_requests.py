@@ -1,5 +1,6 @@
 import pytest
 
+from pymorize.data_request.collection import CMIP6DataRequest
 from pymorize.data_request.variable import DataRequestVariable
 
 
@@ -17,3 +18,8 @@ def dr_sos():
         cell_methods="area: mean where sea",
         cell_measures="area: areacello",
     )
+
+
+@pytest.fixture(scope="session")
+def cmip6_data_request(CMIP_Tables_Dir):
+    return CMIP6DataRequest.from_directory(CMIP_Tables_Dir)
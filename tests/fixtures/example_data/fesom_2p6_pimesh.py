@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 import requests
+import xarray as xr
 
 URL = "https://nextcloud.awi.de/s/AL2cFQx5xGE473S/download/fesom_2p6_pimesh.tar"
 """str : URL to download the example data from."""
@@ -45,3 +46,17 @@ def fesom_2p6_pimesh_esm_tools_data(fesom_2p6_esm_tools_download_data):
 
     # print(f">>> RETURNING: {data_dir / 'fesom_2p6_pimesh' }")
     return data_dir / "fesom_2p6_pimesh"
+
+
+@pytest.fixture(scope="session")
+def fesom_2p6_pimesh_esm_tools_temp_ds(fesom_2p6_pimesh_esm_tools_data):
+    with xr.open_mfdataset(
+        sorted(
+            f
+            for f in (fesom_2p6_pimesh_esm_tools_data / "outdata/fesom/").iterdir()
+            if f.name.startswith("temp.fesom")
+        ),
+        engine="h5netcdf",
+        parallel=True,
+    ) as ds:
+        yield ds
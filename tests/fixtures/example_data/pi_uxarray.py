@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 import requests
+import xarray as xr
 
 URL = "https://nextcloud.awi.de/s/swqyFgbL2jjgjRo/download/pi_uxarray.tar"
 """str : URL to download the example data from."""
@@ -36,3 +37,12 @@ def pi_uxarray_data(pi_uxarray_download_data):
         tar.extractall(data_dir)
 
     return data_dir / "pi_uxarray"
+
+
+@pytest.fixture(scope="session")
+def pi_uxarray_temp_ds(pi_uxarray_data):
+    with xr.open_mfdataset(
+        sorted(f for f in pi_uxarray_data.iterdir() if f.name.startswith("temp")),
+        parallel=True,
+    ) as ds:
+        yield ds
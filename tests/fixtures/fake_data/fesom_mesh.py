@@ -1,3 +1,5 @@
+import shutil
+
 import numpy as np
 import pytest
 import xarray as xr
@@ -19,15 +21,15 @@ def make_fake_grid():
     # coordinate variables
     lat = np.linspace(-90, 90, ncells)
     lon = np.linspace(-180, 180, ncells)
-    # data variables
-    lat_bnds = np.linspace(-90, 90, ncells * vertices).reshape(ncells, vertices)
-    lon_bnds = np.linspace(-180, 180, ncells * vertices).reshape(ncells, vertices)
-    cell_area = np.ones(ncells)
-    node_node_links = np.zeros((ncells, nlinks_max))
-    triag_nodes = np.zeros((ntriags, Three))
-    coast = np.zeros(ncells)
-    depth = np.zeros(nlev)
-    depth_lev = np.zeros(ncells)
+    # data variables (only their names and shapes matter to the tests)
+    lat_bnds = np.zeros((ncells, vertices), dtype=np.float32)
+    lon_bnds = np.zeros((ncells, vertices), dtype=np.float32)
+    cell_area = np.ones(ncells, dtype=np.float32)
+    node_node_links = np.zeros((ncells, nlinks_max), dtype=np.float32)
+    triag_nodes = np.zeros((ntriags, Three), dtype=np.float32)
+    coast = np.zeros(ncells, dtype=np.float32)
+    depth = np.zeros(nlev, dtype=np.float32)
+    depth_lev = np.zeros(ncells, dtype=np.float32)
     fake_grid = xr.Dataset(
         data_vars=dict(
             lat_bnds=(["ncells", "vertices"], lat_bnds),
@@ -49,10 +51,22 @@ def make_fake_grid():
 
 
 @pytest.fixture
-def fake_grid_file(tmp_path):
+def fake_grid():
+    return make_fake_grid()
+
+
+@pytest.fixture(scope="session")
+def fake_grid_template(tmp_path_factory):
+    fake_grid_file = tmp_path_factory.mktemp("grid_template") / "fake_grid.nc"
+    fake_grid = make_fake_grid()
+    fake_grid.to_netcdf(fake_grid_file)
+    return fake_grid_file
+
+
+@pytest.fixture
+def fake_grid_file(tmp_path, fake_grid_template):
     d = tmp_path / "grid"
     d.mkdir()
     fake_grid_file = d / "fake_grid.nc"
-    fake_grid = make_fake_grid()
-    fake_grid.to_netcdf(fake_grid_file)
+    shutil.copy(fake_grid_template, fake_grid_file)
     return fake_grid_file
@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+import xarray as xr
+
+DAYS_2000 = np.arange("2000-01-01", "2001-01-01", dtype="datetime64[D]").astype(
+    "datetime64[ns]"
+)
+"""numpy.ndarray: Daily time axis for all 366 days of 2000, slice it for shorter series"""
+DAYS_2000.flags.writeable = False
+
+
+@pytest.fixture(scope="session")
+def sample_data():
+    """Random daily values for the whole (leap) year 2000, chunked in 30-day blocks."""
+    values = np.random.default_rng(0).random(DAYS_2000.size)
+    return xr.DataArray(values, dims="time", coords={"time": DAYS_2000}).chunk(
+        {"time": 30}
+    )
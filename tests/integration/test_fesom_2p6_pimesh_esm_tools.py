@@ -8,6 +8,8 @@ from pymorize.pipeline import DefaultPipeline
 STEPS = DefaultPipeline.STEPS
 PROGRESSIVE_STEPS = [STEPS[: i + 1] for i in range(len(STEPS))]
 
+pytestmark = pytest.mark.fesom
+
 
 # There is a segfault somewhere in the code, so I'd like to find out where it is...
 @pytest.mark.skip
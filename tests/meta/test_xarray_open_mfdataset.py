@@ -3,6 +3,8 @@ import dask  # noqa
 import pytest
 import xarray as xr
 
+pytestmark = pytest.mark.fesom
+
 
 @pytest.mark.parametrize(
     "engine",
@@ -11,11 +13,11 @@ import xarray as xr
     ],
 )
 def test_open_fesom_2p6_pimesh_esm_tools(fesom_2p6_pimesh_esm_tools_data, engine):
-    matching_files = [
+    matching_files = sorted(
         f
         for f in (fesom_2p6_pimesh_esm_tools_data / "outdata/fesom/").iterdir()
         if f.name.startswith("temp.fesom")
-    ]
+    )
     assert len(matching_files) > 0
     ds = xr.open_mfdataset(
         matching_files,
@@ -34,7 +36,7 @@ def test_open_fesom_2p6_pimesh_esm_tools_cftime(
     fesom_2p6_pimesh_esm_tools_data, engine
 ):
     ds = xr.open_mfdataset(
-        (
+        sorted(
             f
             for f in (fesom_2p6_pimesh_esm_tools_data / "outdata/fesom/").iterdir()
             if f.name.startswith("temp")
@@ -55,7 +57,7 @@ def test_open_fesom_2p6_pimesh_esm_tools_parallel(
     fesom_2p6_pimesh_esm_tools_data, engine
 ):
     ds = xr.open_mfdataset(
-        (
+        sorted(
             f
             for f in (fesom_2p6_pimesh_esm_tools_data / "outdata/fesom/").iterdir()
             if f.name.startswith("temp")
@@ -74,7 +76,7 @@ def test_open_fesom_2p6_pimesh_esm_tools_parallel(
 )
 def test_open_fesom_2p6_pimesh_esm_tools_full(fesom_2p6_pimesh_esm_tools_data, engine):
     ds = xr.open_mfdataset(
-        (
+        sorted(
             f
             for f in (fesom_2p6_pimesh_esm_tools_data / "outdata/fesom/").iterdir()
             if f.name.startswith("temp")
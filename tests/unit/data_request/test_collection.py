@@ -0,0 +1,24 @@
+"""
+Tests for DataRequest
+"""
+
+from pymorize.data_request.table import CMIP6DataRequestTable
+
+
+def test_from_directory_reads_all_tables(cmip6_data_request):
+    assert list(cmip6_data_request.tables) == ["3hr", "Oday", "SIday"]
+    assert all(
+        isinstance(table, CMIP6DataRequestTable)
+        for table in cmip6_data_request.tables.values()
+    )
+
+
+def test_variables_are_keyed_by_table_and_variable_id(cmip6_data_request):
+    drv = cmip6_data_request.variables["Oday.tos"]
+    assert drv.variable_id == "tos"
+    assert drv.frequency == "day"
+
+
+def test_variables_know_their_table_header(cmip6_data_request):
+    drv = cmip6_data_request.variables["3hr.tas"]
+    assert drv.table_header.table_id == "3hr"
@@ -0,0 +1,26 @@
+"""
+Tests for DataRequestTable
+"""
+
+import pytest
+
+from pymorize.data_request.table import CMIP6DataRequestTable
+
+
+def test_get_variable(CMIP_Tables_Dir):
+    table = CMIP6DataRequestTable.from_json_file(CMIP_Tables_Dir / "CMIP6_Oday.json")
+    drv = table.get_variable("tos")
+    assert drv.name == "tos"
+    assert drv.frequency == "day"
+
+
+def test_get_variable_by_other_attribute(CMIP_Tables_Dir):
+    table = CMIP6DataRequestTable.from_json_file(CMIP_Tables_Dir / "CMIP6_Oday.json")
+    drv = table.get_variable("sea_surface_temperature", find_by="standard_name")
+    assert drv.name == "tos"
+
+
+def test_get_variable_raises_for_unknown_name(CMIP_Tables_Dir):
+    table = CMIP6DataRequestTable.from_json_file(CMIP_Tables_Dir / "CMIP6_Oday.json")
+    with pytest.raises(ValueError):
+        table.get_variable("not_a_variable")
@@ -9,6 +9,11 @@ from pymorize.dataset_helpers import (
     needs_resampling,
 )
 
+_NOW = pd.Timestamp("2020-01-01 12:00:00")
+"""Fixed time stamp for tests which only need *some* point in time"""
+_CFTIME_24MS = xr.cftime_range(start="2001", periods=24, freq="MS", calendar="noleap")
+"""Shared, read-only cftime index: two years of monthly steps on a noleap calendar"""
+
 
 def test_no_resampling_required_when_data_timespan_is_less_than_target_timespan():
     t = pd.date_range("2020-01-01 1:00:00", "2020-02-28 1:00:00", freq="D")
@@ -25,7 +30,7 @@ def test_needs_resampling_when_target_timespan_is_lower_than_data_timespan():
 
 
 def test_no_resampling_required_with_single_timestamp_data():
-    da = xr.DataArray(10, coords={"time": pd.Timestamp.now()}, name="t")
+    da = xr.DataArray(10, coords={"time": _NOW}, name="t")
     timespan = "1MS"
     assert needs_resampling(da, timespan) is False
 
@@ -38,8 +43,9 @@ def test_no_resampling_required_when_target_timespan_is_None():
 
 
 def test_is_datetime_type_is_true_for_cftime():
-    dates = xr.cftime_range(start="2001", periods=24, freq="MS", calendar="noleap")
-    da_nl = xr.DataArray(np.arange(24), coords=[dates], dims=["time"], name="foo")
+    da_nl = xr.DataArray(
+        np.arange(24), coords=[_CFTIME_24MS], dims=["time"], name="foo"
+    )
     assert is_datetime_type(da_nl.time.data) is True
 
 
@@ -70,7 +76,7 @@ def test_has_time_axis_is_true_with_time_as_scalar_coordinate():
                     "time",
                 ],
                 [
-                    pd.Timestamp.now(),
+                    _NOW,
                 ],
             )
         },
@@ -124,7 +130,7 @@ def test_get_time_label_can_recognize_scalar_time_dimension():
                 [
                     "time",
                 ],
-                [pd.Timestamp.now()],
+                [_NOW],
             )
         ),
         dims=[
@@ -168,7 +174,7 @@ def test_get_time_label_can_recognize_time_label_even_if_dimension_is_named_diff
                 [
                     "ncells",
                 ],
-                pd.date_range(pd.Timestamp.now(), periods=3, freq="h"),
+                pd.date_range(_NOW, periods=3, freq="h"),
             )
         },
         dims=[
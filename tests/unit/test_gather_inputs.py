@@ -1,15 +1,40 @@
+import pytest
 import xarray as xr
 
+from pymorize.config import PymorizeConfigManager
 from pymorize.gather_inputs import load_mfdataset
+from pymorize.rule import Rule
 
 
+@pytest.mark.fesom
 def test_load_mfdataset_pi_uxarray(pi_uxarray_temp_rule):
     data = load_mfdataset(None, pi_uxarray_temp_rule)
     # Check if load worked correctly and we got back a Dataset
     assert isinstance(data, xr.Dataset)
 
 
+@pytest.mark.fesom
 def test_load_mfdataset_fesom_2p6_esmtools(fesom_2p6_esmtools_temp_rule):
     data = load_mfdataset(None, fesom_2p6_esmtools_temp_rule)
     # Check if load worked correctly and we got back a Dataset
     assert isinstance(data, xr.Dataset)
+
+
+def test_load_mfdataset_single_file(tmp_path):
+    xr.Dataset(
+        {"temp": ("time", [1.0, 2.0, 3.0])},
+        coords={"time": [0, 1, 2]},
+    ).to_netcdf(tmp_path / "temp.fesom.1850.nc")
+    rule = Rule.from_dict(
+        {
+            "name": "temp",
+            "inputs": [{"path": tmp_path, "pattern": "temp.fesom..*.nc"}],
+            "cmor_variable": "thetao",
+            "model_variable": "temp",
+            "_pymorize_cfg": PymorizeConfigManager.from_pymorize_cfg({}),
+        }
+    )
+    data = load_mfdataset(None, rule)
+    assert isinstance(data, xr.Dataset)
+    assert data.temp.chunks is not None
+    assert data.temp.values.tolist() == [1.0, 2.0, 3.0]
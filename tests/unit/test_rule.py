@@ -3,6 +3,9 @@ import re
 from pymorize.pipeline import TestingPipeline
 from pymorize.rule import Rule
 
+_P1 = re.compile("var1.*.nc")
+_P2 = re.compile(r"var1_(?P<year>\d{4}).nc")
+
 
 def test_direct_init(simple_rule):
     rule = simple_rule
@@ -32,6 +35,40 @@ def test_from_dict():
     assert all(isinstance(p, str) for p in rule.pipelines)
 
 
+def test_input_patterns_join_path_and_pattern():
+    rule = Rule.from_dict(
+        {
+            "inputs": [{"path": "/some/files/containing", "pattern": "var1.*.nc"}],
+            "cmor_variable": "var1",
+        }
+    )
+    assert [ip.pattern for ip in rule.input_patterns] == [
+        "/some/files/containing/var1.*.nc"
+    ]
+    assert rule.input_patterns[0].match("/some/files/containing/var1_2000.nc")
+
+
+def test_accepts_precompiled_patterns():
+    rule = Rule(
+        inputs=[
+            {"path": "/some/files/containing/", "pattern": _P1},
+            {"path": "/some/other/files/containing/", "pattern": _P2},
+        ],
+        cmor_variable="var1",
+    )
+    assert [inp.pattern for inp in rule.inputs] == [_P1, _P2]
+    assert rule.inputs[0].pattern is _P1
+    assert all(isinstance(ip, re.Pattern) for ip in rule.input_patterns)
+    # Flags of a precompiled pattern carry over to the full path pattern:
+    rule = Rule(
+        inputs=[
+            {"path": "/data", "pattern": re.compile(r"VAR1_.*\.nc", re.IGNORECASE)}
+        ],
+        cmor_variable="var1",
+    )
+    assert rule.input_patterns[0].match("/data/var1_2000.nc")
+
+
 def test_from_yaml():
     yaml_str = """
     inputs:
@@ -58,6 +58,7 @@ Table 2: Precision of time labels used in file names
 
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import numpy as np
@@ -66,8 +67,23 @@ import pytest
 import xarray as xr
 
 from pymorize.files import _filename_time_range, save_dataset
+from pymorize.rule import Rule
 from pymorize.timeaverage import _get_time_method  # noqa: F401
 
+# Shared, read-only inputs for the parametrized filename tests
+_SINGLE_TIME = pd.Timestamp("2020-01-02 10:10:10")
+_SINGLE_DATA = np.random.random((1, 10))
+_TIME = pd.date_range("2020-01-01 15:12:13", "2021-01-01 06:15:17", freq="D")
+_DATA = np.random.random((_TIME.size, 2))
+
+
+@pytest.fixture(scope="module")
+def monthly_da():
+    """Two years of monthly values, shared by the module: do not modify in place."""
+    dates = xr.cftime_range(start="2001", periods=24, freq="MS", calendar="noleap")
+    return xr.DataArray(np.arange(24), coords=[dates], dims=["time"], name="foo")
+
+
 # Tests for time-span in filename
 
 
@@ -111,8 +127,8 @@ frequency_str = (
 @pytest.mark.parametrize("frequency", frequency_str)
 def test__filename_time_range_allows_single_timestep(frequency):
     ds = xr.DataArray(
-        np.random.random((1, 10)),
-        coords={"time": pd.Timestamp("2020-01-02 10:10:10"), "ncells": list(range(10))},
+        _SINGLE_DATA,
+        coords={"time": _SINGLE_TIME, "ncells": list(range(10))},
         name="singleTS",
     )
     rule = Mock()
@@ -127,15 +143,10 @@ def test__filename_time_range_allows_single_timestep(frequency):
 
 @pytest.mark.parametrize("frequency", frequency_str)
 def test__filename_time_range_multiple_timesteps(frequency):
-    time = pd.date_range(
-        "2020-01-01 15:12:13",
-        "2021-01-01 06:15:17",
-        freq="D",
-    )
     ds = xr.DataArray(
-        np.random.random((time.size, 2)),
+        _DATA,
         coords={
-            "time": time,
+            "time": _TIME,
             "ncells": [1, 2],
         },
         name="yeardata",
@@ -171,22 +182,24 @@ def test__filename_time_range_multiple_timesteps(frequency):
 def test_save_dataset_saves_to_single_file_when_no_time_axis(tmp_path):
     t = tmp_path / "output"
     da = xr.DataArray([1, 2, 3], coords={"ncells": [1, 2, 3]}, dims=["ncells"])
-    rule = Mock()
-    rule.data_request_variable.table.table_id = "Omon"
-    rule.cmor_variable = "CO2"
-    rule.variant_label = "r1i1p1f1"
-    rule.source_id = "GFDL-ESM2M"
-    rule.experiment_id = "historical"
-    rule.file_timespan = "1YE"
-    rule.output_directory = t
-    # rule["institution"] = "AWI"
+    rule = Rule(
+        cmor_variable="CO2",
+        data_request_variable=SimpleNamespace(
+            frequency="fx", table_header=SimpleNamespace(table_id="Omon")
+        ),
+        variant_label="r1i1p1f1",
+        source_id="GFDL-ESM2M",
+        experiment_id="historical",
+        file_timespan="1YE",
+        output_directory=t,
+    )
     save_dataset(da, rule)
+    files = list(t.iterdir())
+    assert len(files) == 1
 
 
-def test_save_dataset_saves_to_single_file(tmp_path):
+def test_save_dataset_saves_to_single_file(tmp_path, monthly_da):
     t = tmp_path / "output"
-    dates = xr.cftime_range(start="2001", periods=24, freq="MS", calendar="noleap")
-    da = xr.DataArray(np.arange(24), coords=[dates], dims=["time"], name="foo")
     rule = Mock()
     rule.data_request_variable.frequency = "mon"
     rule.data_request_variable.table.table_id = "Omon"
@@ -196,15 +209,13 @@ def test_save_dataset_saves_to_single_file(tmp_path):
     rule.experiment_id = "historical"
     rule.file_timespan = "2YE"
     rule.output_directory = t
-    save_dataset(da, rule)
+    save_dataset(monthly_da, rule)
     files = list(t.iterdir())
     assert len(files) == 1
 
 
-def test_save_dataset_saves_to_multiple_files(tmp_path):
+def test_save_dataset_saves_to_multiple_files(tmp_path, monthly_da):
     t = tmp_path / "output"
-    dates = xr.cftime_range(start="2001", periods=24, freq="MS", calendar="noleap")
-    da = xr.DataArray(np.arange(24), coords=[dates], dims=["time"], name="foo")
     rule = Mock()
     rule.data_request_variable.frequency = "mon"
     rule.data_request_variable.table.table_id = "Omon"
@@ -214,6 +225,6 @@ def test_save_dataset_saves_to_multiple_files(tmp_path):
     rule.experiment_id = "historical"
     rule.file_timespan = "6MS"
     rule.output_directory = t
-    save_dataset(da, rule)
+    save_dataset(monthly_da, rule)
     files = list(t.iterdir())
     assert len(files) == 4
@@ -28,7 +28,7 @@ def test_sets_grid_on_dataset(fake_grid_file):
     t = range(84600, 84600 * (ntimesteps + 1), 84600)
     time = cftime.num2date(t, units="seconds since 2686-01-01", calendar="standard")
     da = xr.DataArray(
-        np.random.rand(ntimesteps, ncells),
+        np.zeros((ntimesteps, ncells), dtype=np.float32),
         dims=["time", "ncells"],
         coords={"time": time},
         name="CO2",
@@ -50,14 +50,14 @@ def test_sets_grid_on_dataset(fake_grid_file):
     assert "depth_lev" not in new_da.data_vars
 
 
-def test_renaming_data_dimension_to_match_dimension_in_grid(fake_grid_file):
-    rule = {"grid_file": str(fake_grid_file)}
+def test_renaming_data_dimension_to_match_dimension_in_grid(fake_grid):
+    rule = {"grid": fake_grid}
     nodes_2d = 100
     ntimesteps = 10
     t = range(84600, 84600 * (ntimesteps + 1), 84600)
     time = cftime.num2date(t, units="seconds since 2686-01-01", calendar="standard")
     da = xr.DataArray(
-        np.random.rand(ntimesteps, nodes_2d),
+        np.zeros((ntimesteps, nodes_2d), dtype=np.float32),
         dims=["time", "nodes_2d"],
         coords={"time": time},
         name="CO2",
@@ -68,14 +68,14 @@ def test_renaming_data_dimension_to_match_dimension_in_grid(fake_grid_file):
     assert "ncells" in new_da.sizes
 
 
-def test_skip_grid_setting_if_no_matching_dimension_in_data_is_found(fake_grid_file):
-    rule = {"grid_file": str(fake_grid_file)}
+def test_skip_grid_setting_if_no_matching_dimension_in_data_is_found(fake_grid):
+    rule = {"grid": fake_grid}
     nodes_2d = 50
     ntimesteps = 10
     t = range(84600, 84600 * (ntimesteps + 1), 84600)
     time = cftime.num2date(t, units="seconds since 2686-01-01", calendar="standard")
     da = xr.DataArray(
-        np.random.rand(ntimesteps, nodes_2d),
+        np.zeros((ntimesteps, nodes_2d), dtype=np.float32),
         dims=["time", "nodes_2d"],
         coords={"time": time},
         name="CO2",
@@ -1,11 +1,19 @@
+import re
+
+import dask
 import numpy as np
 import pint
 import pytest
 import xarray as xr
-from chemicals import periodic_table
 
 from pymorize.cmorizer import CMORizer
-from pymorize.units import handle_chemicals, handle_unit_conversion, ureg
+from pymorize.units import (
+    _chemical_element_pattern,
+    _element_molecular_weights,
+    handle_chemicals,
+    handle_unit_conversion,
+    ureg,
+)
 
 #  input samples that are found in CMIP6 tables and in fesom1 (recom)
 allunits = [
@@ -75,6 +83,29 @@ def test_handle_chemicals(test_input):
     ureg(test_input)
 
 
+@pytest.mark.parametrize(
+    "units, symbol",
+    [
+        ("mmolC/m2/d", "C"),
+        ("umolFe/m2/s", "Fe"),
+        ("molCa", "Ca"),
+        ("mole", None),
+        ("mol m-3", None),
+    ],
+)
+def test_chemical_element_pattern_prefers_longest_symbol(units, symbol):
+    match = _chemical_element_pattern().search(units)
+    assert (match and match.group("symbol")) == symbol
+
+
+def test_handle_chemicals_only_defines_units_once(mocker):
+    handle_chemicals("mmolC/m2/d")
+    mock_ureg = mocker.patch("pymorize.units.ureg")
+    handle_chemicals("mmolC/m2/d")
+    mock_ureg.assert_not_called()
+    mock_ureg.define.assert_not_called()
+
+
 def test_can_handle_simple_chemical_elements(rule_with_mass_units, mocker):
     from_unit = "molC"
     to_unit = "g"
@@ -86,9 +117,9 @@ def test_can_handle_simple_chemical_elements(rule_with_mass_units, mocker):
 
     # Set the return value for the property
     mock_getter.return_value = to_unit
-    da = xr.DataArray(10, attrs={"units": from_unit})
+    da = xr.DataArray(np.float64(10), attrs={"units": from_unit})
     new_da = handle_unit_conversion(da, rule_spec)
-    assert new_da.data == np.array(periodic_table.Carbon.MW * 10)
+    assert new_da.data == np.array(_element_molecular_weights()["C"] * 10)
     assert new_da.attrs["units"] == to_unit
 
 
@@ -103,7 +134,7 @@ def test_can_handle_chemical_elements(rule_with_data_request, mocker):
 
     # Set the return value for the property
     mock_getter.return_value = to_unit
-    da = xr.DataArray(10, attrs={"units": from_unit})
+    da = xr.DataArray(np.float64(10), attrs={"units": from_unit})
     new_da = handle_unit_conversion(da, rule_spec)
     assert np.allclose(new_da.data, np.array(1.39012731e-09))
     assert new_da.attrs["units"] == to_unit
@@ -122,10 +153,10 @@ def test_user_defined_units_takes_precedence_over_units_in_dataarray(
 
     # Set the return value for the property
     mock_getter.return_value = to_unit
-    da = xr.DataArray(10, attrs={"units": "kg"})
+    da = xr.DataArray(np.float64(10), attrs={"units": "kg"})
     # here, "molC" will be used instead of "kg"
     new_da = handle_unit_conversion(da, rule_spec)
-    assert new_da.data == np.array(periodic_table.Carbon.MW * 10)
+    assert new_da.data == np.array(_element_molecular_weights()["C"] * 10)
     assert new_da.attrs["units"] == to_unit
 
 
@@ -135,6 +166,18 @@ def test_without_defining_uraninum_to_weight_conversion_raises_error():
         ureg("mmolU/m**2/d")
 
 
+def test_handle_chemicals_skips_units_without_mol(mocker):
+    get_pattern = mocker.patch("pymorize.units._chemical_element_pattern")
+    handle_chemicals("m s-1")
+    get_pattern.assert_not_called()
+
+
+def test_handle_chemicals_raises_for_unknown_element():
+    pattern = re.compile(r"mol(?P<symbol>Xx)")
+    with pytest.raises(ValueError, match="Unknown chemical element Xx in molXx"):
+        handle_chemicals("mmolXx/m2/d", pattern)
+
+
 def test_recognizes_previous_defined_chemical_elements():
     assert "mmolC/m^2/d" in ureg
 
@@ -149,7 +192,7 @@ def test_when_target_units_is_None_overrides_existing_units(
     if hasattr(drv, "unit"):
         drv.unit = from_unit
     rule_spec.model_unit = None
-    da = xr.DataArray(10, attrs={"units": from_unit})
+    da = xr.DataArray(np.float64(10), attrs={"units": from_unit})
     new_da = handle_unit_conversion(da, rule_spec)
     assert new_da.attrs["units"] == drv.unit
 
@@ -160,7 +203,7 @@ def test_when_tartget_unit_is_empty_string_raises_error(
 ):
     rule_spec = rule_with_data_request
     rule_spec.model_unit = ""
-    da = xr.DataArray(10, attrs={"units": from_unit})
+    da = xr.DataArray(np.float64(10), attrs={"units": from_unit})
     with pytest.raises(ValueError):
         handle_unit_conversion(da, rule_spec)
 
@@ -168,7 +211,7 @@ def test_when_tartget_unit_is_empty_string_raises_error(
 def test_not_defined_unit_checker(rule_with_data_request):
     """Test the checker for unit not defined from the output"""
     rule_spec = rule_with_data_request
-    da = xr.DataArray(10, name="var1", attrs={"units": None})
+    da = xr.DataArray(np.float64(10), name="var1", attrs={"units": None})
 
     with pytest.raises(ValueError, match="Unit not defined"):
         new_da = handle_unit_conversion(da, rule_spec)  # noqa: F841
@@ -181,7 +224,7 @@ def test_data_request_missing_unit(rule_with_data_request):
     """Test for missing unit attribute in the data request"""
     rule_spec = rule_with_data_request
     del rule_spec.data_request_variable.units
-    da = xr.DataArray(10, name="var1", attrs={"units": "kg m-2 s-1"})
+    da = xr.DataArray(np.float64(10), name="var1", attrs={"units": "kg m-2 s-1"})
 
     with pytest.raises(
         AttributeError, match="DataRequestVariable' object has no attribute 'unit'"
@@ -199,7 +242,7 @@ def test_data_request_not_defined_unit(rule_with_data_request, mocker):
     # Set the return value for the property
     mock_getter.return_value = None
 
-    da = xr.DataArray(10, name="var1", attrs={"units": "kg m-2 s-1"})
+    da = xr.DataArray(np.float64(10), name="var1", attrs={"units": "kg m-2 s-1"})
 
     with pytest.raises(ValueError, match="Unit not defined"):
         new_da = handle_unit_conversion(da, rule_spec)  # noqa: F841
@@ -215,7 +258,7 @@ def test_dimensionless_unit_missing_in_unit_mapping(rule_with_data_request, mock
 
     # Set the return value for the property
     mock_getter.return_value = "0.1"
-    da = xr.DataArray(10, name="var1", attrs={"units": "g/kg"})
+    da = xr.DataArray(np.float64(10), name="var1", attrs={"units": "g/kg"})
 
     with pytest.raises(KeyError, match="Dimensionless unit not found in mappings"):
         handle_unit_conversion(da, rule_spec)
@@ -231,7 +274,7 @@ def test_units_with_g_kg_to_0001_g_kg(rule_sos, CMIP_Tables_Dir):
         general_cfg={"CMIP_Tables_Dir": CMIP_Tables_Dir, "cmor_version": "CMIP6"},
         rules_cfg=[rule_sos],
     )
-    da = xr.DataArray(10, name="sos", attrs={"units": "g/kg"})
+    da = xr.DataArray(np.float64(10), name="sos", attrs={"units": "g/kg"})
 
     new_da = handle_unit_conversion(da, cmorizer.rules[0])
     assert new_da.attrs.get("units") == "0.001"
@@ -249,7 +292,7 @@ def test_units_with_g_g_to_0001_g_kg(rule_sos, CMIP_Tables_Dir):
         general_cfg={"CMIP_Tables_Dir": CMIP_Tables_Dir, "cmor_version": "CMIP6"},
         rules_cfg=[rule_sos],
     )
-    da = xr.DataArray(10, name="sos", attrs={"units": "g/g"})
+    da = xr.DataArray(np.float64(10), name="sos", attrs={"units": "g/g"})
 
     new_da = handle_unit_conversion(da, cmorizer.rules[0])
     assert new_da.attrs.get("units") == "0.001"
@@ -266,7 +309,54 @@ def test_catch_unit_conversion_problem(rule_with_data_request, mocker):
 
     # Set the return value for the property
     mock_getter.return_value = "broken_kg m-2 s-1"
-    da = xr.DataArray(10, name="var1", attrs={"units": "broken_kg m-2 s-1"})
+    da = xr.DataArray(np.float64(10), name="var1", attrs={"units": "broken_kg m-2 s-1"})
 
     with pytest.raises(ValueError, match="Unit conversion failed: Cannot parse units:"):
         handle_unit_conversion(da, rule_spec)
+
+
+def test_catch_incompatible_units(rule_with_data_request, mocker):
+    rule_spec = rule_with_data_request
+    mock_getter = mocker.patch.object(
+        type(rule_spec.data_request_variable), "units", new_callable=mocker.PropertyMock
+    )
+    mock_getter.return_value = "m"
+    da = xr.DataArray(np.float64(10), name="var1", attrs={"units": "kg"})
+
+    with pytest.raises(ValueError, match="Unit conversion failed: Incompatible units"):
+        handle_unit_conversion(da, rule_spec)
+
+
+def test_converts_units_with_offset(rule_with_data_request, mocker):
+    """Offset units (e.g. degC -> K) cannot use a plain factor and go through pint"""
+    rule_spec = rule_with_data_request
+    mock_getter = mocker.patch.object(
+        type(rule_spec.data_request_variable), "units", new_callable=mocker.PropertyMock
+    )
+    mock_getter.return_value = "K"
+    da = xr.DataArray([0.0, 10.0], name="var1", attrs={"units": "degC"})
+    new_da = handle_unit_conversion(da, rule_spec)
+    np.testing.assert_allclose(new_da.values, [273.15, 283.15])
+    assert new_da.attrs["units"] == "K"
+
+
+@pytest.mark.parametrize(
+    "from_unit, to_unit",
+    [
+        ("molC", "kg"),
+        ("degC", "K"),
+    ],
+)
+def test_unit_conversion_keeps_dask_arrays_lazy(
+    rule_with_data_request, mocker, from_unit, to_unit
+):
+    rule_spec = rule_with_data_request
+    mock_getter = mocker.patch.object(
+        type(rule_spec.data_request_variable), "units", new_callable=mocker.PropertyMock
+    )
+    mock_getter.return_value = to_unit
+    da = xr.DataArray(np.arange(4.0), dims="x", attrs={"units": from_unit}).chunk(2)
+    new_da = handle_unit_conversion(da, rule_spec)
+    assert dask.is_dask_collection(new_da.data)
+    assert new_da.chunks == da.chunks
+    assert new_da.attrs["units"] == to_unit
@@ -3,8 +3,9 @@ import pytest
 from pymorize.validate import PIPELINES_SCHEMA, PipelineValidator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def validator():
+    # validate() resets the errors of previous runs, so the tests can share it
     return PipelineValidator(PIPELINES_SCHEMA)
 
 